@@ -1,23 +1,53 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, filedialog
 import json
+import os
+import sys
 import datetime
-from dataclasses import dataclass, asdict
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import pandas as pd
 from enum import Enum
-import webbrowser
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib encoder
+    orjson = None
+
+def _dumps(data) -> bytes:
+    """Serialize data to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def _loads(raw: bytes):
+    """Parse JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Imports and daily logs tend to repeat the same date many times in a row
+_last_date_str = None
+_last_date_val = None
+
+def _parse_date(value: str) -> datetime.date:
+    """Parse a YYYY-MM-DD date, raising ValueError if it is malformed"""
+    global _last_date_str, _last_date_val
+    if value is _last_date_str or value == _last_date_str:
+        return _last_date_val
+    parsed = datetime.date.fromisoformat(value)
+    _last_date_str, _last_date_val = value, parsed
+    return parsed
+
+_fmt_money = "${:.2f}".format
 
 class TransactionType(Enum):
     INCOME = "income"
     EXPENSE = "expense"
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     id: int
     type: TransactionType
@@ -26,113 +56,416 @@ class Transaction:
     description: str
     date: str
     tags: List[str] = None
+    month: str = field(default=None, init=False, repr=False, compare=False)
+    _desc_lc: str = field(default=None, init=False, repr=False, compare=False)
+    _tags_lc: List[str] = field(default=None, init=False, repr=False, compare=False)
+    _is_expense: bool = field(default=False, init=False, repr=False, compare=False)
+    _search_blob: str = field(default=None, init=False, repr=False, compare=False)
+    _amount_str: str = field(default=None, init=False, repr=False, compare=False)
+    _type_str: str = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
+        # Interned so category dict lookups hash and compare by identity
+        self.category = sys.intern(self.category)
+        self._is_expense = self.type is TransactionType.EXPENSE
+        # Dates are always stored as YYYY-MM-DD, so the month key is a plain slice
+        self.month = self.date[:7]
+        # Lowercased copies for case-insensitive search
+        self._desc_lc = self.description.lower()
+        self._tags_lc = [tag.lower() for tag in self.tags]
+        # NUL-separated so a query can never match across the description/tag boundary
+        self._search_blob = "\x00".join([self._desc_lc] + self._tags_lc)
+        # Display strings for the transaction lists
+        self._amount_str = _fmt_money(self.amount)
+        self._type_str = "Expense" if self._is_expense else "Income"
+    
+    def to_dict(self) -> Dict:
+        """Convert to the record stored in the data file"""
+        return {
+            'id': self.id,
+            'type': self.type.value,
+            'amount': self.amount,
+            'category': self.category,
+            'description': self.description,
+            'date': self.date,
+            'tags': self.tags
+        }
+    
+    @classmethod
+    def from_dict(cls, item: Dict) -> 'Transaction':
+        """Build a transaction from a stored record"""
+        return cls(
+            id=item['id'],
+            type=TransactionType(item['type']),
+            amount=item['amount'],
+            category=item['category'],
+            description=item['description'],
+            date=item['date'],
+            tags=item.get('tags', [])
+        )
 
 class ExpenseTracker:
+    # Rewrite the snapshot once this many changes have piled up in the log
+    LOG_COMPACT_THRESHOLD = 1000
+    
     def __init__(self, data_file="expense_data.json"):
         self.data_file = data_file
+        # Changes since the last snapshot are appended here, one JSON object per line
+        self.log_file = data_file + ".log"
+        self._log_fp = None
+        self._log_entries = 0
         self.transactions: List[Transaction] = []
+        self._serialized: List[Dict] = []  # file records, parallel to self.transactions
+        self._id_to_idx: Dict[int, int] = {}  # position of each id in self.transactions
         self.budget_limits: Dict[str, float] = {}
         self.categories = {
             'income': ['Salary', 'Business', 'Investment', 'Freelance', 'Other Income'],
             'expense': ['Food', 'Transport', 'Entertainment', 'Utilities', 'Healthcare', 'Shopping', 'Education', 'Other']
         }
+        # Running aggregates, kept in sync on add/delete so reads don't rescan
+        self._totals = {'income': 0.0, 'expenses': 0.0}
+        self._cat_spent = defaultdict(float)
+        self._by_month = defaultdict(lambda: {'income': 0.0, 'expenses': 0.0})
+        self._cat_by_month = defaultdict(lambda: defaultdict(float))
+        self._month_counts = Counter()
+        self._row_counts = Counter()  # rows behind each aggregate bucket
+        # Transactions ordered by date, with the dates alongside for bisecting
+        self._by_date: List[Transaction] = []
+        self._dates: List[str] = []
+        self._months_listeners = []
+        self._months_sorted = None  # get_available_months() result until the month set changes
+        self._next_id = 1
+        self._agg_version = 0  # bumped on every change that can affect totals or alerts
+        self._batch_depth = 0
+        self._dirty = False
         self.load_data()
     
     def load_data(self):
-        """Load data from JSON file"""
+        """Load data from JSON file, then replay changes logged since it was written"""
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                data = _loads(f.read())
                 self.transactions = [
-                    Transaction(
-                        id=item['id'],
-                        type=TransactionType(item['type']),
-                        amount=item['amount'],
-                        category=item['category'],
-                        description=item['description'],
-                        date=item['date'],
-                        tags=item.get('tags', [])
-                    ) for item in data.get('transactions', [])
+                    Transaction.from_dict(item) for item in data.get('transactions', [])
                 ]
                 self.budget_limits = data.get('budget_limits', {})
+                self._next_id = data.get('next_id', 1)
         except FileNotFoundError:
             self.transactions = []
             self.budget_limits = {}
+        
+        log_intact = self._replay_log()
+        self._rebuild_indexes()
+        if not log_intact or self._log_entries > self.LOG_COMPACT_THRESHOLD:
+            self.save_data()
+    
+    def _replay_log(self) -> bool:
+        """Apply logged changes on top of the loaded snapshot; False if the log ends in a torn write"""
+        self._log_entries = 0
+        try:
+            with open(self.log_file, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return True
+        
+        # Replay is idempotent, so entries already folded into the snapshot are harmless
+        by_id = {t.id: t for t in self.transactions}
+        intact = True
+        for line in lines:
+            try:
+                entry = _loads(line)
+            except ValueError:
+                # Interrupted append; everything before it is still good
+                intact = False
+                break
+            
+            if entry['op'] == 'add':
+                transaction = Transaction.from_dict(entry['transaction'])
+                by_id.setdefault(transaction.id, transaction)
+                self._next_id = max(self._next_id, transaction.id + 1)
+            elif entry['op'] == 'delete':
+                by_id.pop(entry['id'], None)
+            elif entry['op'] == 'budget':
+                self.budget_limits[entry['category']] = entry['limit']
+            self._log_entries += 1
+        
+        self.transactions = list(by_id.values())
+        return intact
+    
+    def _log_change(self, entry: Dict):
+        """Append one change to the log (or, inside a batch, leave it for the closing snapshot)"""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        
+        if self._log_fp is None:
+            self._log_fp = open(self.log_file, 'ab')
+        # Not flushed here; flush()/close() or the next snapshot push it out
+        self._log_fp.write(_dumps(entry) + b"\n")
+        self._log_entries += 1
+        
+        if self._log_entries > self.LOG_COMPACT_THRESHOLD:
+            self.save_data()
+    
+    def flush(self):
+        """Hand buffered log entries to the OS"""
+        if self._log_fp is not None:
+            self._log_fp.flush()
+    
+    def close(self):
+        """Flush and close the change log"""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+    
+    def _rebuild_indexes(self):
+        """Recompute the running aggregates from the transaction list in one pass"""
+        totals = self._totals = {'income': 0.0, 'expenses': 0.0}
+        cat_spent = self._cat_spent
+        by_month = self._by_month
+        cat_by_month = self._cat_by_month
+        month_counts = self._month_counts
+        row_counts = self._row_counts
+        cat_spent.clear()
+        by_month.clear()
+        cat_by_month.clear()
+        month_counts.clear()
+        row_counts.clear()
+        
+        # Only adding here, so skip the per-row bookkeeping _index_transaction does for removals
+        for transaction in self.transactions:
+            month = transaction.month
+            amount = transaction.amount
+            kind = 'expenses' if transaction._is_expense else 'income'
+            month_counts[month] += 1
+            row_counts[kind] += 1
+            row_counts[(month, kind)] += 1
+            totals[kind] += amount
+            by_month[month][kind] += amount
+            if transaction._is_expense:
+                category = transaction.category
+                row_counts[(kind, category)] += 1
+                row_counts[(month, kind, category)] += 1
+                cat_spent[category] += amount
+                cat_by_month[month][category] += amount
+        
+        self._by_date = sorted(self.transactions, key=lambda t: (t.date, t.id))
+        self._dates = [t.date for t in self._by_date]
+        self._serialized = [t.to_dict() for t in self.transactions]
+        self._id_to_idx = {t.id: i for i, t in enumerate(self.transactions)}
+        # Never hand out an id again, even after the rows that used it are deleted or cleared
+        self._next_id = max(self._next_id, max((t.id for t in self.transactions), default=0) + 1)
+        self._agg_version += 1
+        self._notify_months_changed()
+    
+    def _index_transaction(self, transaction: Transaction, sign: int):
+        """Add (sign=1) or remove (sign=-1) a transaction from the running aggregates"""
+        self._agg_version += 1
+        month = transaction.month
+        amount = sign * transaction.amount
+        kind = 'expenses' if transaction._is_expense else 'income'
+        
+        # Buckets whose last row is removed go back to exactly zero (or disappear)
+        # rather than keeping float rounding noise around
+        if self._count_rows(kind, sign):
+            self._totals[kind] += amount
+        else:
+            self._totals[kind] = 0.0
+        
+        if self._count_rows((month, kind), sign):
+            self._by_month[month][kind] += amount
+        else:
+            self._by_month[month][kind] = 0.0
+        
+        if transaction._is_expense:
+            category = transaction.category
+            
+            if self._count_rows((kind, category), sign):
+                self._cat_spent[category] += amount
+            else:
+                del self._cat_spent[category]
+            
+            if self._count_rows((month, kind, category), sign):
+                self._cat_by_month[month][category] += amount
+            else:
+                del self._cat_by_month[month][category]
+                if not self._cat_by_month[month]:
+                    del self._cat_by_month[month]
+        
+        self._month_counts[month] += sign
+        months_changed = self._month_counts[month] == (1 if sign > 0 else 0)
+        if not self._month_counts[month]:
+            del self._month_counts[month]
+            del self._by_month[month]
+        
+        # Ordered by (date, id) so same-day transactions keep their insertion order
+        # however self.transactions happens to be laid out
+        date = transaction.date
+        position = bisect_left(self._by_date, transaction.id,
+                               bisect_left(self._dates, date), bisect_right(self._dates, date),
+                               key=lambda t: t.id)
+        if sign > 0:
+            self._dates.insert(position, date)
+            self._by_date.insert(position, transaction)
+        else:
+            del self._dates[position]
+            del self._by_date[position]
+        
+        # Last, so listeners see the tracker fully updated
+        if months_changed:
+            self._notify_months_changed()
+    
+    def _count_rows(self, key, sign: int) -> int:
+        """Adjust the row count behind an aggregate bucket and return what remains"""
+        self._row_counts[key] += sign
+        remaining = self._row_counts[key]
+        if not remaining:
+            del self._row_counts[key]
+        return remaining
+    
+    @property
+    def agg_version(self) -> int:
+        """Counter that changes whenever totals or budget alerts may have changed"""
+        return self._agg_version
+    
+    def add_months_listener(self, callback):
+        """Register a callback run whenever a month gains its first or loses its last transaction"""
+        self._months_listeners.append(callback)
+    
+    def _notify_months_changed(self):
+        self._months_sorted = None
+        for callback in self._months_listeners:
+            callback()
+    
+    def clear_data(self):
+        """Remove all transactions and budget limits"""
+        self.transactions = []
+        self.budget_limits = {}
+        self._rebuild_indexes()
+        # The log can't express a clear, so replace the snapshot instead
+        self.save_data()
+    
+    @contextmanager
+    def batch(self):
+        """Group several changes into a single save when the outermost batch exits"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.save_data()
     
     def save_data(self):
-        """Save data to JSON file"""
+        """Save a full snapshot to the JSON file and start a fresh change log"""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._dirty = False
+        
         data = {
-            'transactions': [
-                {
-                    'id': t.id,
-                    'type': t.type.value,
-                    'amount': t.amount,
-                    'category': t.category,
-                    'description': t.description,
-                    'date': t.date,
-                    'tags': t.tags
-                } for t in self.transactions
-            ],
-            'budget_limits': self.budget_limits
+            'transactions': self._serialized,
+            'budget_limits': self.budget_limits,
+            'next_id': self._next_id
         }
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write to a temporary file and swap it in, so a crash mid-write can't corrupt the data
+        temp_file = self.data_file + ".tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.data_file)
+        
+        # Everything in the log is now part of the snapshot
+        self.close()
+        try:
+            os.remove(self.log_file)
+        except FileNotFoundError:
+            pass
+        self._log_entries = 0
     
     def get_next_id(self):
         """Get next available transaction ID"""
-        if not self.transactions:
-            return 1
-        return max(t.id for t in self.transactions) + 1
+        return self._next_id
     
     def add_transaction(self, type: TransactionType, amount: float, category: str, 
-                       description: str, tags: List[str] = None):
-        """Add a new transaction"""
+                       description: str, tags: List[str] = None, date: Optional[str] = None):
+        """Add a new transaction, dated today unless a YYYY-MM-DD date is given"""
         if tags is None:
             tags = []
         
+        if date is None:
+            date = datetime.date.today().isoformat()
+        else:
+            date = _parse_date(date).isoformat()
+        
         transaction = Transaction(
             id=self.get_next_id(),
             type=type,
             amount=amount,
             category=category,
             description=description,
-            date=datetime.datetime.now().strftime("%Y-%m-%d"),
+            date=date,
             tags=tags
         )
+        self._next_id += 1
         
+        self._id_to_idx[transaction.id] = len(self.transactions)
         self.transactions.append(transaction)
-        self.save_data()
+        self._serialized.append(transaction.to_dict())
+        self._index_transaction(transaction, 1)
+        self._log_change({'op': 'add', 'transaction': self._serialized[-1]})
         return transaction
     
+    def add_transactions_bulk(self, records) -> List[Transaction]:
+        """Add many transactions with a single save at the end
+        
+        Each record is a tuple of add_transaction arguments:
+        (type, amount, category, description[, tags[, date]])
+        """
+        with self.batch():
+            return [self.add_transaction(*record) for record in records]
+    
     def set_budget_limit(self, category: str, limit: float):
         """Set budget limit for a category"""
         self.budget_limits[category] = limit
-        self.save_data()
+        self._agg_version += 1
+        self._log_change({'op': 'budget', 'category': category, 'limit': limit})
     
     def get_category_spending(self, month: Optional[str] = None) -> Dict[str, float]:
         """Get total spending by category for a specific month"""
-        spending = {}
-        
-        for transaction in self.transactions:
-            if transaction.type == TransactionType.EXPENSE:
-                trans_date = datetime.datetime.strptime(transaction.date, "%Y-%m-%d")
-                
-                if month is None or trans_date.strftime("%Y-%m") == month:
-                    spending[transaction.category] = spending.get(transaction.category, 0) + transaction.amount
-        
-        return spending
+        if month is not None:
+            return dict(self._cat_by_month.get(month, {}))
+        return dict(self._cat_spent)
+    
+    def get_available_months(self) -> List[str]:
+        """Get months that have transactions, newest first"""
+        if self._months_sorted is None:
+            self._months_sorted = sorted(self._month_counts, reverse=True)
+        return list(self._months_sorted)
+    
+    def get_recent_transactions(self, limit: Optional[int] = None) -> List[Transaction]:
+        """Get transactions newest first, optionally only the latest `limit` of them"""
+        if limit is None:
+            return self._by_date[::-1]
+        return self._by_date[:-limit - 1:-1]
     
     def check_budget_alerts(self, month: Optional[str] = None) -> List[Dict]:
         """Check for budget limit violations"""
         alerts = []
-        category_spending = self.get_category_spending(month)
+        if not self.budget_limits:
+            return alerts
+        
+        # Only look up the categories that actually have a limit
+        if month is not None:
+            spending = self._cat_by_month.get(month, {})
+        else:
+            spending = self._cat_spent
         
         for category, limit in self.budget_limits.items():
-            spent = category_spending.get(category, 0)
+            spent = spending.get(category, 0)
             if spent > limit:
                 alerts.append({
                     'category': category,
@@ -145,17 +478,12 @@ class ExpenseTracker:
     
     def calculate_profit_loss(self, month: Optional[str] = None) -> Dict:
         """Calculate profit/loss for a specific period"""
-        total_income = 0
-        total_expenses = 0
-        
-        for transaction in self.transactions:
-            trans_date = datetime.datetime.strptime(transaction.date, "%Y-%m-%d")
-            
-            if month is None or trans_date.strftime("%Y-%m") == month:
-                if transaction.type == TransactionType.INCOME:
-                    total_income += transaction.amount
-                else:
-                    total_expenses += transaction.amount
+        if month is not None:
+            totals = self._by_month.get(month, {'income': 0, 'expenses': 0})
+        else:
+            totals = self._totals
+        total_income = totals['income']
+        total_expenses = totals['expenses']
         
         net_profit = total_income - total_expenses
         profit_margin = (net_profit / total_income * 100) if total_income > 0 else 0
@@ -170,62 +498,77 @@ class ExpenseTracker:
     
     def get_monthly_summary(self) -> Dict[str, Dict]:
         """Get monthly summary of income and expenses"""
-        monthly_data = {}
-        
-        for transaction in self.transactions:
-            month = transaction.date[:7]  # YYYY-MM
-            
-            if month not in monthly_data:
-                monthly_data[month] = {'income': 0, 'expenses': 0}
-            
-            if transaction.type == TransactionType.INCOME:
-                monthly_data[month]['income'] += transaction.amount
-            else:
-                monthly_data[month]['expenses'] += transaction.amount
-        
-        return monthly_data
+        return {month: dict(totals) for month, totals in self._by_month.items()}
     
-    def generate_spending_report(self, month: Optional[str] = None):
-        """Generate a visual spending report"""
+    def generate_spending_report(self, month: Optional[str] = None, fig=None):
+        """Generate a visual spending report, redrawing into fig if one is given"""
         category_spending = self.get_category_spending(month)
         
         if not category_spending:
             return None
         
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+        if fig is None:
+            # Imported here so startup doesn't pay for matplotlib until a report is drawn
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            fig = Figure(figsize=(10, 8))
+            # Render off-screen with Agg so exports never touch the Tk backend
+            FigureCanvasAgg(fig)
+        else:
+            fig.clear()
+        ax1, ax2 = fig.subplots(2, 1)
         
         # Pie chart
-        ax1.pie(category_spending.values(), labels=category_spending.keys(), autopct='%1.1f%%')
+        ax1.pie(category_spending.values(), labels=category_spending.keys(), autopct='%1.1f%%',
+                wedgeprops={'rasterized': True})
         ax1.set_title('Spending by Category')
         
         # Bar chart
         categories = list(category_spending.keys())
         amounts = list(category_spending.values())
-        bars = ax2.bar(categories, amounts, color='skyblue')
+        bars = ax2.bar(categories, amounts, color='skyblue', rasterized=True)
         ax2.set_title('Spending Amounts by Category')
         ax2.set_xticklabels(categories, rotation=45)
         
         # Add value labels on bars
         for bar, amount in zip(bars, amounts):
             ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(amounts)*0.01,
-                    f'${amount:.2f}', ha='center', va='bottom')
+                    _fmt_money(amount), ha='center', va='bottom')
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
     def delete_transaction(self, transaction_id: int):
         """Delete a transaction by ID"""
-        self.transactions = [t for t in self.transactions if t.id != transaction_id]
-        self.save_data()
+        index = self._id_to_idx.pop(transaction_id, None)
+        if index is None:
+            return
+        
+        # Fill the hole with the last row; display order comes from the date index
+        transaction = self.transactions[index]
+        last = self.transactions.pop()
+        last_record = self._serialized.pop()
+        if last is not transaction:
+            self.transactions[index] = last
+            self._serialized[index] = last_record
+            self._id_to_idx[last.id] = index
+        self._index_transaction(transaction, -1)
+        self._log_change({'op': 'delete', 'id': transaction_id})
     
     def search_transactions(self, query: str, search_type: str = "all") -> List[Transaction]:
         """Search transactions by description or tags"""
+        query = query.lower()
+        if search_type == "all":
+            return [t for t in self._by_date if query in t._search_blob]
+        
         results = []
+        match_description = search_type == "description"
+        match_tags = search_type == "tags"
         
-        for transaction in self.transactions:
-            if search_type in ["all", "description"] and query.lower() in transaction.description.lower():
+        for transaction in self._by_date:
+            if match_description and query in transaction._desc_lc:
                 results.append(transaction)
-            elif search_type in ["all", "tags"] and any(query.lower() in tag.lower() for tag in transaction.tags):
+            elif match_tags and any(query in tag for tag in transaction._tags_lc):
                 results.append(transaction)
         
         return results
@@ -234,6 +577,8 @@ class DeveloperContact:
     @staticmethod
     def show_developer_info():
         """Show developer contact information"""
+        import webbrowser
+        
         info_window = tk.Toplevel()
         info_window.title("Developer Contact Information")
         info_window.geometry("500x400")
@@ -307,8 +652,21 @@ class ExpenseTrackerGUI:
     def __init__(self, root):
         self.root = root
         self.tracker = ExpenseTracker()
+        # Dashboard stats as of a given tracker.agg_version
+        self._cached_version = None
+        self._cached_pl = None
+        self._cached_alerts = None
+        # Data-driven tabs that need re-rendering the next time they are shown
+        self._tab_dirty = {"📊 Dashboard": True, "💳 Transactions": True, "💰 Budget": True}
+        # Rows currently shown in each treeview, as {iid: values}
+        self._tree_state = {}
+        self._refresh_pending = False
+        # Matplotlib figure reused by every PNG export, created on first use
+        self._report_fig = None
         self.setup_gui()
+        self.tracker.add_months_listener(self.update_month_choices)
         self.refresh_dashboard()
+        self.root.after(1000, self._flush_log)
     
     def setup_gui(self):
         """Setup the main GUI"""
@@ -586,9 +944,9 @@ class ExpenseTrackerGUI:
                 font=('Arial', 11)).pack(side=tk.LEFT, padx=5)
         
         self.analysis_month = tk.StringVar(value="all")
-        month_combo = ttk.Combobox(month_frame, textvariable=self.analysis_month,
-                                  values=["all"] + self.get_available_months(), font=('Arial', 11))
-        month_combo.pack(side=tk.LEFT, padx=5)
+        self.analysis_month_combo = ttk.Combobox(month_frame, textvariable=self.analysis_month,
+                                                 values=["all"] + self.get_available_months(), font=('Arial', 11))
+        self.analysis_month_combo.pack(side=tk.LEFT, padx=5)
         
         ttk.Button(month_frame, text="Analyze", 
                   command=self.analyze_profit_loss).pack(side=tk.LEFT, padx=10)
@@ -597,7 +955,33 @@ class ExpenseTrackerGUI:
         self.results_frame = tk.Frame(self.analysis_tab, bg='#2c3e50')
         self.results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Will be populated by analysis results
+        # Result widgets are built once here; analyze_profit_loss only updates their text
+        self.analysis_title = tk.Label(self.results_frame, font=('Arial', 16, 'bold'), fg='white', bg='#2c3e50')
+        self.results_display = tk.Frame(self.results_frame, bg='#34495e', padx=20, pady=20)
+        
+        self.metric_labels = {}
+        metrics = [
+            ("income", "Total Income:"),
+            ("expenses", "Total Expenses:"),
+            ("net", "Net Profit/Loss:"),
+            ("margin", "Profit Margin:")
+        ]
+        
+        for key, label in metrics:
+            row_frame = tk.Frame(self.results_display, bg='#34495e')
+            row_frame.pack(fill=tk.X, pady=8)
+            
+            tk.Label(row_frame, text=label, font=('Arial', 12, 'bold'),
+                    fg='white', bg='#34495e', width=15, anchor='w').pack(side=tk.LEFT)
+            self.metric_labels[key] = tk.Label(row_frame, font=('Arial', 12, 'bold'), bg='#34495e')
+            self.metric_labels[key].pack(side=tk.LEFT, padx=10)
+        
+        # Profitability status
+        status_frame = tk.Frame(self.results_display, bg='#34495e')
+        status_frame.pack(pady=20)
+        
+        self.metric_labels["status"] = tk.Label(status_frame, font=('Arial', 14, 'bold'), bg='#34495e')
+        self.metric_labels["status"].pack()
     
     def create_reports_tab(self):
         """Create reports tab"""
@@ -612,16 +996,21 @@ class ExpenseTrackerGUI:
                 font=('Arial', 11)).pack(side=tk.LEFT, padx=5)
         
         self.report_month = tk.StringVar(value="all")
-        report_combo = ttk.Combobox(report_frame, textvariable=self.report_month,
-                                   values=["all"] + self.get_available_months(), font=('Arial', 11))
-        report_combo.pack(side=tk.LEFT, padx=5)
+        self.report_month_combo = ttk.Combobox(report_frame, textvariable=self.report_month,
+                                               values=["all"] + self.get_available_months(), font=('Arial', 11))
+        self.report_month_combo.pack(side=tk.LEFT, padx=5)
         
         ttk.Button(report_frame, text="Generate Report", 
                   command=self.generate_report_gui).pack(side=tk.LEFT, padx=10)
+        ttk.Button(report_frame, text="Export PNG", 
+                  command=self.export_report_gui).pack(side=tk.LEFT, padx=5)
         
-        # Chart frame
+        # Chart frame with a single canvas that is redrawn for every report
         self.chart_frame = tk.Frame(self.reports_tab, bg='#2c3e50')
         self.chart_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        self.report_canvas = tk.Canvas(self.chart_frame, bg='#2c3e50', highlightthickness=0)
+        self.report_canvas.pack(fill=tk.BOTH, expand=True)
     
     def update_categories(self, *args):
         """Update categories based on transaction type"""
@@ -652,7 +1041,7 @@ class ExpenseTrackerGUI:
             
             messagebox.showinfo("Success", "Transaction added successfully!")
             self.clear_form()
-            self.refresh_dashboard()
+            self.mark_tabs_dirty()
             
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {str(e)}")
@@ -691,8 +1080,7 @@ class ExpenseTrackerGUI:
         
         if messagebox.askyesno("Confirm", "Are you sure you want to delete this transaction?"):
             self.tracker.delete_transaction(trans_id)
-            self.refresh_transactions_list()
-            self.refresh_dashboard()
+            self.mark_tabs_dirty()
             messagebox.showinfo("Success", "Transaction deleted successfully!")
     
     def set_budget_gui(self):
@@ -710,15 +1098,17 @@ class ExpenseTrackerGUI:
                 return
             
             self.tracker.set_budget_limit(category, limit)
-            messagebox.showinfo("Success", f"Budget limit of ${limit:.2f} set for {category}")
+            messagebox.showinfo("Success", f"Budget limit of {_fmt_money(limit)} set for {category}")
             self.budget_category.set("")
             self.budget_amount.set(0)
+            self.mark_tabs_dirty()
             
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {str(e)}")
     
     def check_budget_alerts_gui(self):
         """Check and display budget alerts"""
+        self._tab_dirty["💰 Budget"] = False
         alerts = self.tracker.check_budget_alerts()
         
         self.alerts_text.delete(1.0, tk.END)
@@ -730,9 +1120,9 @@ class ExpenseTrackerGUI:
         for alert in alerts:
             self.alerts_text.insert(tk.END, 
                 f"🚨 BUDGET EXCEEDED: {alert['category']}\n"
-                f"   Limit: ${alert['limit']:.2f}\n"
-                f"   Spent: ${alert['spent']:.2f}\n"
-                f"   Exceeded by: ${alert['exceeded_by']:.2f}\n\n")
+                f"   Limit: {_fmt_money(alert['limit'])}\n"
+                f"   Spent: {_fmt_money(alert['spent'])}\n"
+                f"   Exceeded by: {_fmt_money(alert['exceeded_by'])}\n\n")
     
     def analyze_profit_loss(self):
         """Analyze profit/loss"""
@@ -742,42 +1132,15 @@ class ExpenseTrackerGUI:
         
         result = self.tracker.calculate_profit_loss(month)
         
-        # Clear previous results
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
-        
-        # Create results display
         period = month if month else "All Time"
-        title = tk.Label(self.results_frame, text=f"Profit/Loss Analysis - {period}", 
-                        font=('Arial', 16, 'bold'), fg='white', bg='#2c3e50')
-        title.pack(pady=10)
-        
-        # Results in a frame
-        results_display = tk.Frame(self.results_frame, bg='#34495e', padx=20, pady=20)
-        results_display.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        # Create result labels
-        metrics = [
-            ("Total Income:", f"${result['total_income']:.2f}", "#27ae60"),
-            ("Total Expenses:", f"${result['total_expenses']:.2f}", "#e74c3c"),
-            ("Net Profit/Loss:", f"${result['net_profit']:.2f}", 
-             "#27ae60" if result['net_profit'] > 0 else "#e74c3c"),
-            ("Profit Margin:", f"{result['profit_margin']:.2f}%", 
-             "#27ae60" if result['profit_margin'] > 0 else "#e74c3c")
-        ]
+        self.analysis_title.config(text=f"Profit/Loss Analysis - {period}")
         
-        for i, (label, value, color) in enumerate(metrics):
-            row_frame = tk.Frame(results_display, bg='#34495e')
-            row_frame.pack(fill=tk.X, pady=8)
-            
-            tk.Label(row_frame, text=label, font=('Arial', 12, 'bold'),
-                    fg='white', bg='#34495e', width=15, anchor='w').pack(side=tk.LEFT)
-            tk.Label(row_frame, text=value, font=('Arial', 12, 'bold'),
-                    fg=color, bg='#34495e').pack(side=tk.LEFT, padx=10)
-        
-        # Profitability status
-        status_frame = tk.Frame(results_display, bg='#34495e')
-        status_frame.pack(pady=20)
+        self.metric_labels["income"].config(text=_fmt_money(result['total_income']), fg="#27ae60")
+        self.metric_labels["expenses"].config(text=_fmt_money(result['total_expenses']), fg="#e74c3c")
+        self.metric_labels["net"].config(text=_fmt_money(result['net_profit']),
+                                         fg="#27ae60" if result['net_profit'] > 0 else "#e74c3c")
+        self.metric_labels["margin"].config(text=f"{result['profit_margin']:.2f}%",
+                                            fg="#27ae60" if result['profit_margin'] > 0 else "#e74c3c")
         
         if result['is_profitable']:
             status_text = "🎉 PROFITABLE! Your finances are in good shape!"
@@ -786,8 +1149,12 @@ class ExpenseTrackerGUI:
             status_text = "💸 RUNNING AT LOSS! Consider reducing expenses or increasing income."
             status_color = "#e74c3c"
         
-        tk.Label(status_frame, text=status_text, font=('Arial', 14, 'bold'),
-                fg=status_color, bg='#34495e').pack()
+        self.metric_labels["status"].config(text=status_text, fg=status_color)
+        
+        # The results stay hidden until the first analysis
+        if not self.analysis_title.winfo_manager():
+            self.analysis_title.pack(pady=10)
+            self.results_display.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
     
     def generate_report_gui(self):
         """Generate visual report"""
@@ -795,76 +1162,177 @@ class ExpenseTrackerGUI:
         if month == "all":
             month = None
         
-        fig = self.tracker.generate_spending_report(month)
+        self._draw_category_pie(self.report_canvas, self.tracker.get_category_spending(month))
+    
+    def _draw_category_pie(self, canvas, totals):
+        """Draw a spending pie chart with a legend directly on a Tk canvas"""
+        canvas.delete("all")
+        width = max(canvas.winfo_width(), 400)
+        height = max(canvas.winfo_height(), 300)
+        
+        if not totals:
+            canvas.create_text(width / 2, height / 2, text="No spending data available for the selected period.",
+                               font=('Arial', 12), fill='white')
+            return
         
-        # Clear previous chart
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
+        colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6',
+                  '#1abc9c', '#e67e22', '#95a5a6', '#f1c40f', '#34495e']
+        total = sum(totals.values())
+        diameter = min(height - 40, width / 2 - 40)
+        x0, y0 = 20, (height - diameter) / 2
+        
+        canvas.create_text(x0 + diameter / 2, y0 - 10, text="Spending by Category",
+                           font=('Arial', 14, 'bold'), fill='white')
+        
+        start = 90.0
+        legend_x = x0 + diameter + 40
+        legend_y = max(y0, 20)
+        for i, (category, amount) in enumerate(totals.items()):
+            color = colors[i % len(colors)]
+            extent = 360.0 * amount / total
+            if extent >= 359.99:
+                # Tk can't draw a full-circle arc
+                canvas.create_oval(x0, y0, x0 + diameter, y0 + diameter, fill=color, outline='#2c3e50')
+            else:
+                canvas.create_arc(x0, y0, x0 + diameter, y0 + diameter, start=start, extent=-extent,
+                                  fill=color, outline='#2c3e50')
+            start -= extent
+            
+            canvas.create_rectangle(legend_x, legend_y + 4, legend_x + 14, legend_y + 18, fill=color, outline='')
+            canvas.create_text(legend_x + 24, legend_y + 11, anchor='w', font=('Arial', 11), fill='white',
+                               text=f"{category}: {_fmt_money(amount)} ({amount / total * 100:.1f}%)")
+            legend_y += 28
+    
+    def export_report_gui(self):
+        """Save the full matplotlib spending report as a PNG file"""
+        month = self.report_month.get()
+        if month == "all":
+            month = None
         
+        fig = self.tracker.generate_spending_report(month, fig=self._report_fig)
         if fig is None:
-            tk.Label(self.chart_frame, text="No spending data available for the selected period.",
-                    font=('Arial', 12), fg='white', bg='#2c3e50').pack(expand=True)
+            messagebox.showinfo("Export", "No spending data available for the selected period.")
             return
+        self._report_fig = fig
         
-        # Embed chart in Tkinter
-        canvas = FigureCanvasTkAgg(fig, self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        path = filedialog.asksaveasfilename(defaultextension=".png",
+                                            filetypes=[("PNG image", "*.png")])
+        if path:
+            fig.savefig(path)
+            messagebox.showinfo("Success", f"Report saved to {path}")
     
     def get_available_months(self):
         """Get list of available months from transactions"""
-        months = set()
-        for transaction in self.tracker.transactions:
-            month = transaction.date[:7]
-            months.add(month)
-        return sorted(months, reverse=True)
+        return self.tracker.get_available_months()
+    
+    def update_month_choices(self):
+        """Update the month pickers in place when the set of months changes"""
+        values = ("all",) + tuple(self.get_available_months())
+        self.analysis_month_combo['values'] = values
+        self.report_month_combo['values'] = values
     
     def refresh_dashboard(self):
         """Refresh dashboard data"""
-        # Update quick stats
-        result = self.tracker.calculate_profit_loss()
-        alerts = self.tracker.check_budget_alerts()
-        
-        self.income_card.config(text=f"${result['total_income']:.2f}")
-        self.expense_card.config(text=f"${result['total_expenses']:.2f}")
-        self.profit_card.config(text=f"${result['net_profit']:.2f}")
+        self._tab_dirty["📊 Dashboard"] = False
+        
+        # Update quick stats, recomputing only if the tracker changed since last time
+        if self._cached_version != self.tracker.agg_version:
+            self._cached_pl = self.tracker.calculate_profit_loss()
+            self._cached_alerts = self.tracker.check_budget_alerts()
+            self._cached_version = self.tracker.agg_version
+        result = self._cached_pl
+        alerts = self._cached_alerts
+        
+        self.income_card.config(text=_fmt_money(result['total_income']))
+        self.expense_card.config(text=_fmt_money(result['total_expenses']))
+        self.profit_card.config(text=_fmt_money(result['net_profit']))
         self.profit_card.config(fg="#27ae60" if result['net_profit'] > 0 else "#e74c3c")
         self.budget_card.config(text=str(len(alerts)))
         
         # Update recent transactions
-        for item in self.transactions_tree.get_children():
-            self.transactions_tree.delete(item)
-        
-        recent_trans = sorted(self.tracker.transactions, key=lambda x: x.date, reverse=True)[:10]
-        for trans in recent_trans:
-            self.transactions_tree.insert('', tk.END, values=(
+        recent_trans = self.tracker.get_recent_transactions(10)
+        self._sync_tree(self.transactions_tree, [
+            (str(trans.id), (
                 trans.date,
-                "Income" if trans.type == TransactionType.INCOME else "Expense",
-                f"${trans.amount:.2f}",
+                trans._type_str,
+                trans._amount_str,
                 trans.category,
                 trans.description
-            ))
+            )) for trans in recent_trans
+        ])
     
     def refresh_transactions_list(self):
         """Refresh transactions list"""
-        for item in self.trans_list_tree.get_children():
-            self.trans_list_tree.delete(item)
-        
-        for trans in sorted(self.tracker.transactions, key=lambda x: x.date, reverse=True):
-            self.trans_list_tree.insert('', tk.END, values=(
+        self._tab_dirty["💳 Transactions"] = False
+        self.update_transactions_tree(self.tracker.get_recent_transactions())
+    
+    def update_transactions_tree(self, transactions):
+        """Show the given transactions in the transactions list"""
+        self._sync_tree(self.trans_list_tree, [
+            (str(trans.id), (
                 trans.id,
                 trans.date,
-                "Income" if trans.type == TransactionType.INCOME else "Expense",
-                f"${trans.amount:.2f}",
+                trans._type_str,
+                trans._amount_str,
                 trans.category,
                 trans.description,
                 ", ".join(trans.tags)
-            ))
+            )) for trans in transactions
+        ])
+    
+    def _sync_tree(self, tree, rows):
+        """Make a treeview show the given (iid, values) rows, touching only rows that changed"""
+        shown = self._tree_state.setdefault(tree, {})
+        wanted = dict(rows)
+        
+        stale = [iid for iid in shown if iid not in wanted]
+        if stale:
+            tree.delete(*stale)
+        
+        # Rows already shown keep their relative order, so inserting each new row
+        # at its target index lands it in the right place
+        for index, (iid, values) in enumerate(rows):
+            previous = shown.get(iid)
+            if previous is None:
+                tree.insert('', index, iid=iid, values=values)
+            elif previous != values:
+                tree.item(iid, values=values)
+        
+        # Only reorder when the same rows come back in a different order (e.g. search results)
+        order = [iid for iid, _ in rows]
+        if list(tree.get_children()) != order:
+            for index, iid in enumerate(order):
+                tree.move(iid, '', index)
+        
+        self._tree_state[tree] = wanted
+    
+    def _flush_log(self):
+        """Periodically push buffered change-log entries to disk"""
+        self.tracker.flush()
+        self.root.after(1000, self._flush_log)
+    
+    def mark_tabs_dirty(self):
+        """Flag every data-driven tab as stale and schedule a re-render of the visible one"""
+        for tab in self._tab_dirty:
+            self._tab_dirty[tab] = True
+        
+        # Bursts of changes collapse into a single refresh once Tk is idle
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._run_pending_refresh)
+    
+    def _run_pending_refresh(self):
+        self._refresh_pending = False
+        self.on_tab_change(None)
     
     def on_tab_change(self, event):
         """Handle tab change events"""
         current_tab = self.notebook.tab(self.notebook.select(), "text")
         
+        # Nothing changed since this tab was last rendered
+        if not self._tab_dirty.get(current_tab):
+            return
+        
         if current_tab == "📊 Dashboard":
             self.refresh_dashboard()
         elif current_tab == "💳 Transactions":
@@ -876,25 +1344,27 @@ def demo_setup():
     """Set up demo data for testing"""
     tracker = ExpenseTracker("demo_data.json")
     
-    # Clear existing data
-    tracker.transactions = []
-    tracker.budget_limits = {}
-    
-    # Set budget limits
-    tracker.set_budget_limit("Food", 300)
-    tracker.set_budget_limit("Transport", 150)
-    tracker.set_budget_limit("Entertainment", 200)
-    
-    # Add sample income
-    tracker.add_transaction(TransactionType.INCOME, 5000, "Salary", "Monthly salary", ["salary", "work"])
-    tracker.add_transaction(TransactionType.INCOME, 500, "Freelance", "Web development project", ["freelance", "programming"])
-    
-    # Add sample expenses
-    tracker.add_transaction(TransactionType.EXPENSE, 150, "Food", "Groceries", ["groceries", "supermarket"])
-    tracker.add_transaction(TransactionType.EXPENSE, 75, "Food", "Restaurant dinner", ["dining", "restaurant"])
-    tracker.add_transaction(TransactionType.EXPENSE, 50, "Transport", "Gas", ["car", "fuel"])
-    tracker.add_transaction(TransactionType.EXPENSE, 100, "Entertainment", "Movie night", ["movies", "fun"])
-    tracker.add_transaction(TransactionType.EXPENSE, 80, "Shopping", "New clothes", ["clothing", "fashion"])
+    with tracker.batch():
+        # Clear existing data
+        tracker.clear_data()
+        
+        # Set budget limits
+        tracker.set_budget_limit("Food", 300)
+        tracker.set_budget_limit("Transport", 150)
+        tracker.set_budget_limit("Entertainment", 200)
+        
+        tracker.add_transactions_bulk([
+            # Sample income
+            (TransactionType.INCOME, 5000, "Salary", "Monthly salary", ["salary", "work"]),
+            (TransactionType.INCOME, 500, "Freelance", "Web development project", ["freelance", "programming"]),
+            
+            # Sample expenses
+            (TransactionType.EXPENSE, 150, "Food", "Groceries", ["groceries", "supermarket"]),
+            (TransactionType.EXPENSE, 75, "Food", "Restaurant dinner", ["dining", "restaurant"]),
+            (TransactionType.EXPENSE, 50, "Transport", "Gas", ["car", "fuel"]),
+            (TransactionType.EXPENSE, 100, "Entertainment", "Movie night", ["movies", "fun"]),
+            (TransactionType.EXPENSE, 80, "Shopping", "New clothes", ["clothing", "fashion"])
+        ])
     
     print("✅ Demo data created successfully!")
     return tracker
@@ -908,3 +1378,4 @@ if __name__ == "__main__":
     app = ExpenseTrackerGUI(root)
 
     root.mainloop()
+    app.tracker.close()